@@ -12,7 +12,7 @@ router = APIRouter()
 
 
 @router.get("/status/{user_id}")
-def get_alert_status(user_id: int, db: Session = get_db()):
+def get_alert_status(user_id: int, db: Session = Depends(get_db)):
     twin = db.query(Twin).filter(Twin.user_id == user_id).first()
     twin = get_twin_or_404(db, twin.id)
     status = get_current_status(twin)
@@ -1,22 +1,28 @@
 # app/api/calorie_routes.py
+from datetime import date
 from typing import List, Dict
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel, ConfigDict
 
 from sqlalchemy.orm import Session
 
-from app.database.db import get_db
+from app.database.db import get_db, run_in_db_pool
+from app.utils.cache import cache_enabled, cache_get, cache_set
 from app.nutrition.nutrition_service import (
     log_meal,
     get_daily_summary,
     get_meal_history,
+    daily_summary_cache_key,
 )
 from app.nutrition.nutrition_mlops import (
     retrain_food_mlops,
     list_food_models,
     active_food_model,
 )
+from app.nutrition.food_ml_model import USE_FOOD_ML_MODEL, load_active_food_model
 
 router = APIRouter()
 
@@ -41,14 +47,13 @@ class MealLogRead(BaseModel):
     twin_id: int
     date: str
     meal_type: str
-    items: List[Dict[str, float]]
+    items: List[MealItem]
     calories: float
     protein: float
     carbs: float
     fat: float
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class DailySummaryRead(BaseModel):
@@ -58,8 +63,14 @@ class DailySummaryRead(BaseModel):
     required_calories: float
     calorie_balance: float
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+def get_food_model():
+    # Goes through the path/mtime-aware model cache on every request, so a
+    # model promoted by any worker's retrain is picked up by all of them.
+    # None when the lookup table is used.
+    return load_active_food_model() if USE_FOOD_ML_MODEL else None
 
 
 # -----------------------------
@@ -67,16 +78,19 @@ class DailySummaryRead(BaseModel):
 # -----------------------------
 
 @router.post("/meal", response_model=Dict[str, object])
-def log_breakfast(
+async def log_breakfast(
     payload: MealLogCreate,
-    db: Session = get_db(),
+    db: Session = Depends(get_db),
+    food_model=Depends(get_food_model),
 ):
     try:
-        meal, daily = log_meal(
+        meal, daily = await run_in_db_pool(
+            log_meal,
             db=db,
             twin_id=payload.twin_id,
             meal_type=payload.meal_type,
-            items=[m.dict() for m in payload.items],
+            items=[m.model_dump() for m in payload.items],
+            food_model=food_model,
         )
     except ValueError as e:
         raise HTTPException(
@@ -105,56 +119,95 @@ def log_breakfast(
     }
 
 
-@router.get("/daily/{twin_id}", response_model=DailySummaryRead)
-def get_today_summary(
+def _meal_history_rows(
+    db: Session,
     twin_id: int,
-    db: Session = get_db(),
+    limit: int,
+    offset: int,
+) -> List[Dict[str, object]]:
+    logs = get_meal_history(db, twin_id, limit=limit, offset=offset)
+    result: List[Dict[str, object]] = []
+
+    for m in logs:
+        try:
+            items = orjson.loads(m.food_json)
+        except orjson.JSONDecodeError:
+            items = []
+        result.append({
+            "id": m.id,
+            "twin_id": m.twin_id,
+            "date": m.date.isoformat(),
+            "meal_type": m.meal_type,
+            "items": items,
+            "calories": m.calories,
+            "protein": m.protein,
+            "carbs": m.carbs,
+            "fat": m.fat,
+        })
+    return result
+
+
+def _daily_summary_body(db: Session, twin_id: int) -> bytes:
+    # Serialized JSON is cached per (twin, day, generation) when Redis is
+    # configured; log_meal bumps the generation after each commit
+    key = None
+    if cache_enabled():
+        key = daily_summary_cache_key(twin_id, date.today())
+        body = cache_get(key)
+        if body is not None:
+            return body
+
+    daily = get_daily_summary(db, twin_id)
+    body = orjson.dumps({
+        "twin_id": daily.twin_id,
+        "date": str(daily.date),
+        "total_calories": daily.total_calories,
+        "required_calories": daily.required_calories,
+        "calorie_balance": daily.calorie_balance,
+    })
+    if key is not None:
+        cache_set(key, body)
+    return body
+
+
+# The read endpoints below hand back plain dicts through ORJSONResponse:
+# the rows come straight from our own tables, so re-validating them through
+# the Pydantic schema (and jsonable_encoder) on every poll is wasted work.
+# The schemas stay attached via `responses=` so the OpenAPI docs are unchanged.
+
+@router.get(
+    "/daily/{twin_id}",
+    response_class=ORJSONResponse,
+    responses={200: {"model": DailySummaryRead}},
+)
+async def get_today_summary(
+    twin_id: int,
+    db: Session = Depends(get_db),
 ):
     try:
-        daily = get_daily_summary(db, twin_id)
+        body = await run_in_db_pool(_daily_summary_body, db, twin_id)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e),
         )
 
-    return DailySummaryRead(
-        twin_id=daily.twin_id,
-        date=str(daily.date),
-        total_calories=daily.total_calories,
-        required_calories=daily.required_calories,
-        calorie_balance=daily.calorie_balance,
-    )
+    return Response(content=body, media_type="application/json")
 
 
-@router.get("/history/{twin_id}", response_model=List[MealLogRead])
-def list_meals(
+@router.get(
+    "/history/{twin_id}",
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[MealLogRead]}},
+)
+async def list_meals(
     twin_id: int,
-    db: Session = get_db(),
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
 ):
-    logs = get_meal_history(db, twin_id)
-    result: List[MealLogRead] = []
-    import json as _json
-
-    for m in logs:
-        try:
-            items = _json.loads(m.food_json)
-        except Exception:
-            items = []
-        result.append(
-            MealLogRead(
-                id=m.id,
-                twin_id=m.twin_id,
-                date=str(m.date),
-                meal_type=m.meal_type,
-                items=items,
-                calories=m.calories,
-                protein=m.protein,
-                carbs=m.carbs,
-                fat=m.fat,
-            )
-        )
-    return result
+    result = await run_in_db_pool(_meal_history_rows, db, twin_id, limit, offset)
+    return ORJSONResponse(result)
 
 
 # -----------------------------
@@ -1,6 +1,6 @@
 # app/api/nutrition_routes.py
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
 from app.database.db import get_db
@@ -12,7 +12,7 @@ router = APIRouter()
 
 
 @router.get("/recommendation/{user_id}")
-def nutrition_recommendation(user_id: int, db: Session = get_db()):
+def nutrition_recommendation(user_id: int, db: Session = Depends(get_db)):
     twin = db.query(Twin).filter(Twin.user_id == user_id).first()
     twin = get_twin_or_404(db, twin.id)
 
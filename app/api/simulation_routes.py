@@ -2,7 +2,7 @@
 from fastapi import APIRouter
 from fastapi import Depends, HTTPException
 from sqlalchemy.orm import Session
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 from app.database.db import get_db
 from app.database.simulation_schema import SimulationRun, SimulationCreate, SimulationRead
@@ -14,7 +14,7 @@ router = APIRouter()
 
 
 @router.post("/run", response_model=SimulationRead)
-def simulate(payload: SimulationCreate, db: Session = get_db()):
+def simulate(payload: SimulationCreate, db: Session = Depends(get_db)):
     twin = get_twin_or_404(db, payload.twin_id)
 
     result = run_simulation(
@@ -38,15 +38,15 @@ def simulate(payload: SimulationCreate, db: Session = get_db()):
 
 
 @router.get("/result/{simulation_id}", response_model=SimulationRead)
-def get_simulation(simulation_id: int, db: Session = get_db()):
+def get_simulation(simulation_id: int, db: Session = Depends(get_db)):
     sim = db.query(SimulationRun).filter(SimulationRun.id == simulation_id).first()
     if not sim:
         raise HTTPException(status_code=404, detail="Simulation not found")
     return sim
 
 
-@router.get("/history/{user_id}")
-def get_simulation_history(user_id: int, db: Session = get_db()):
+@router.get("/history/{user_id}", response_model=List[SimulationRead])
+def get_simulation_history(user_id: int, db: Session = Depends(get_db)):
     sims = (
         db.query(SimulationRun)
         .filter(SimulationRun.user_id == user_id)
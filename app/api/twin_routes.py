@@ -1,20 +1,27 @@
 # app/api/twin_routes.py
+from typing import List
+
+import numpy as np
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from app.database.db import get_db
 from app.database.twin_schema import Twin, TwinCreate, TwinRead
-from app.utils.helpers import get_user_or_404
+from app.database.user_schema import User
+from app.utils.helpers import get_user_or_404, twin_to_dict
 from app.core.baseline_model import build_baseline_for_twin
-from app.ml.health_score_model import compute_scores_from_features
+from app.ml.health_score_model import (
+    compute_scores_from_features,
+    compute_scores_from_features_batch,
+)
+from app.nutrition.nutrition_service import estimate_required_calories
 
 router = APIRouter()
 
-@router.post("/create", response_model=TwinRead)
-def create_twin(payload: TwinCreate, db: Session = get_db()):
-    user = get_user_or_404(db, payload.user_id)
 
-    twin = Twin(
+def _twin_from_payload(payload: TwinCreate) -> Twin:
+    return Twin(
         user_id=payload.user_id,
         name=payload.name,
 
@@ -54,6 +61,20 @@ def create_twin(payload: TwinCreate, db: Session = get_db()):
         aqi=payload.aqi,
     )
 
+
+# Twins are serialized straight from their columns via ORJSONResponse;
+# the Pydantic schemas are kept in `responses=` for the OpenAPI docs only.
+
+@router.post(
+    "/create",
+    response_class=ORJSONResponse,
+    responses={200: {"model": TwinRead}},
+)
+def create_twin(payload: TwinCreate, db: Session = Depends(get_db)):
+    user = get_user_or_404(db, payload.user_id)
+
+    twin = _twin_from_payload(payload)
+
     # ✅ AUTO SCORE COMPUTATION
     bmi = payload.weight_kg / ((payload.height_cm / 100) ** 2)
 
@@ -76,16 +97,77 @@ def create_twin(payload: TwinCreate, db: Session = get_db()):
     twin.organ_load_score = scores["organ_load_score"]
     twin.lung_risk_score = scores.get("lung_risk_score")
 
+    # Invariant for the twin, so computed once here rather than per meal
+    twin.required_calories = estimate_required_calories(twin)
+
     db.add(twin)
     db.commit()
     db.refresh(twin)
 
-    return twin
+    return ORJSONResponse(twin_to_dict(twin))
+
+
+@router.post(
+    "/create_batch",
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[TwinRead]}},
+)
+def create_twins_batch(payloads: List[TwinCreate], db: Session = Depends(get_db)):
+    if not payloads:
+        return ORJSONResponse([])
+
+    user_ids = {p.user_id for p in payloads}
+    found = {
+        row.id for row in db.query(User.id).filter(User.id.in_(user_ids)).all()
+    }
+    if user_ids - found:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    twins = [_twin_from_payload(p) for p in payloads]
+
+    # ✅ AUTO SCORE COMPUTATION – one NumPy pass for the whole batch
+    def col(name):
+        return np.array([getattr(p, name) for p in payloads], dtype=float)
+
+    height = col("height_cm")
+    weight = col("weight_kg")
+    bmi = weight / ((height / 100) ** 2)
+
+    scores = compute_scores_from_features_batch({
+        "bmi": bmi,
+        "systolic_bp": col("systolic_bp"),
+        "fasting_sugar": col("fasting_sugar"),
+        "cholesterol": col("cholesterol"),
+        "sleep_hours": col("sleep_hours"),
+        "exercise_level": col("exercise_level"),
+        "stress_level": col("stress_level"),
+        "smoking": col("smoking"),
+        "alcohol": col("alcohol"),
+        "aqi": np.array([p.aqi or 100 for p in payloads], dtype=float),
+    })
+
+    for i, twin in enumerate(twins):
+        twin.heart_score = float(scores["heart_score"][i])
+        twin.metabolic_score = float(scores["metabolic_score"][i])
+        twin.mental_stress_score = float(scores["mental_stress_score"][i])
+        twin.organ_load_score = float(scores["organ_load_score"][i])
+        twin.required_calories = estimate_required_calories(twin)
+
+    # return_defaults fills in primary keys; the objects stay detached so
+    # they are not expired by the commit.
+    db.bulk_save_objects(twins, return_defaults=True)
+    db.commit()
+
+    return ORJSONResponse([twin_to_dict(t) for t in twins])
 
 
-@router.get("/{user_id}", response_model=TwinRead)
-def get_twin(user_id: int, db: Session = get_db()):
+@router.get(
+    "/{user_id}",
+    response_class=ORJSONResponse,
+    responses={200: {"model": TwinRead}},
+)
+def get_twin(user_id: int, db: Session = Depends(get_db)):
     twin = db.query(Twin).filter(Twin.user_id == user_id).first()
     if not twin:
         raise HTTPException(status_code=404, detail="Twin not found")
-    return twin
+    return ORJSONResponse(twin_to_dict(twin))
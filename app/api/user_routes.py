@@ -1,38 +1,77 @@
 # app/api/user_routes.py
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from passlib.context import CryptContext
+import anyio
 
-from app.database.db import get_db
+from app.database.db import get_db, run_in_db_pool
 from app.database.user_schema import User, UserCreate, UserRead
+from app.utils.helpers import user_to_dict
 
 router = APIRouter()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# argon2id for new hashes (tuned to the OWASP minimum); bcrypt is kept so
+# hashes created before the switch still verify.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__memory_cost=19456,
+    argon2__time_cost=2,
+    argon2__parallelism=1,
+)
 
 
-@router.post("/register", response_model=UserRead)
-def register_user(payload: UserCreate, db: Session = get_db()):
-    existing = db.query(User).filter(User.email == payload.email).first()
-    if existing:
-        raise HTTPException(status_code=400, detail="Email already registered")
-
-    # hashed = pwd_context.hash(payload.password)
-    raw_password = payload.password.strip()
+def _email_registered(db: Session, email: str) -> bool:
+    # Index lookup on users.email; selects only the id, no ORM instance
+    return db.query(User.id).filter(User.email == email).scalar() is not None
 
-    if len(raw_password.encode("utf-8")) > 72:
-        raw_password = raw_password[:72]
 
-    hashed = pwd_context.hash(raw_password)
-    user = User(email=payload.email, name=payload.name, password_hash=hashed)
+def _insert_user(db: Session, email: str, name: str, password_hash: str) -> User:
+    user = User(email=email, name=name, password_hash=password_hash)
     db.add(user)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        # Roll back here, on the worker thread, not on the event loop
+        db.rollback()
+        raise
     db.refresh(user)
     return user
 
 
-@router.get("/{user_id}", response_model=UserRead)
-def get_user(user_id: int, db: Session = get_db()):
+@router.post(
+    "/register",
+    response_class=ORJSONResponse,
+    responses={200: {"model": UserRead}},
+)
+async def register_user(payload: UserCreate, db: Session = Depends(get_db)):
+    if await run_in_db_pool(_email_registered, db, payload.email):
+        raise HTTPException(status_code=400, detail="Email already registered")
+
+    # hashed = pwd_context.hash(payload.password)
+    raw_password = payload.password.strip()
+
+    # Hashing is CPU-bound; keep it off the event loop
+    hashed = await anyio.to_thread.run_sync(pwd_context.hash, raw_password)
+    try:
+        user = await run_in_db_pool(
+            _insert_user, db, payload.email, payload.name, hashed
+        )
+    except IntegrityError:
+        # Unique index on email catches a concurrent registration
+        raise HTTPException(status_code=400, detail="Email already registered")
+    return ORJSONResponse(user_to_dict(user))
+
+
+@router.get(
+    "/{user_id}",
+    response_class=ORJSONResponse,
+    responses={200: {"model": UserRead}},
+)
+def get_user(user_id: int, db: Session = Depends(get_db)):
     user = db.query(User).filter(User.id == user_id).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    return user
+    return ORJSONResponse(user_to_dict(user))
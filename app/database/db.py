@@ -1,4 +1,8 @@
 import os
+import functools
+from typing import Generator
+
+import anyio
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 
@@ -8,24 +12,43 @@ DB_PATH = os.path.join(BASE_DIR, "app.db")
 
 DATABASE_URL = f"sqlite:///{DB_PATH}"
 
+DB_POOL_SIZE = 20
+DB_MAX_OVERFLOW = 40
+
 engine = create_engine(
     DATABASE_URL,
-    connect_args={"check_same_thread": False}
+    connect_args={"check_same_thread": False},
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
-# ✅ Dependency for FastAPI routes
-def get_db():
-    from fastapi import Depends
-    from typing import Generator
+# ✅ Dependency for FastAPI routes: use as `db: Session = Depends(get_db)`
+def get_db() -> Generator:
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+# ✅ Bounded worker pool for blocking DB work called from async routes.
+# Sized to the engine pool so threads never queue on a connection.
+_db_limiter = None
+
+
+def _get_db_limiter() -> anyio.CapacityLimiter:
+    global _db_limiter
+    if _db_limiter is None:
+        _db_limiter = anyio.CapacityLimiter(DB_POOL_SIZE + DB_MAX_OVERFLOW)
+    return _db_limiter
 
-    def _get_db() -> Generator:
-        db = SessionLocal()
-        try:
-            yield db
-        finally:
-            db.close()
 
-    return Depends(_get_db)
+async def run_in_db_pool(func, *args, **kwargs):
+    return await anyio.to_thread.run_sync(
+        functools.partial(func, *args, **kwargs),
+        limiter=_get_db_limiter(),
+    )
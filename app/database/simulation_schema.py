@@ -1,7 +1,7 @@
 # app/database/simulation_schema.py
 from sqlalchemy import Column, Integer, Float, String, ForeignKey, JSON
 from sqlalchemy.orm import relationship
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Dict, Any
 
 from app.database.db import Base
@@ -39,5 +39,4 @@ class SimulationRead(BaseModel):
     duration_years: int
     result_summary: Dict[str, Any]
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
@@ -1,7 +1,7 @@
 # app/database/twin_schema.py
 from sqlalchemy import Column, Integer, Float, String, ForeignKey
 from sqlalchemy.orm import relationship
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 
 from app.database.db import Base
@@ -53,6 +53,7 @@ class Twin(Base):
     metabolic_score = Column(Float, nullable=True)
     mental_stress_score = Column(Float, nullable=True)
     organ_load_score = Column(Float, nullable=True)
+    required_calories = Column(Float, nullable=True)  # daily kcal need
     
     
 
@@ -146,9 +147,6 @@ class TwinRead(BaseModel):
     metabolic_score: Optional[float]
     mental_stress_score: Optional[float]
     organ_load_score: Optional[float]
+    required_calories: Optional[float]
 
-    class Config:
-        orm_mode = True
-
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
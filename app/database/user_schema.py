@@ -1,7 +1,7 @@
 # app/database/user_schema.py
 from sqlalchemy import Column, Integer, String
 from app.database.db import Base
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, ConfigDict
 
 class User(Base):
     __tablename__ = "users"
@@ -23,5 +23,4 @@ class UserRead(BaseModel):
     email: EmailStr
     name: str
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
@@ -14,10 +14,15 @@ from app.api.calorie_routes import router as calorie_router
 # ✅ IMPORTANT: force nutrition tables to register with SQLAlchemy
 from app.nutrition import nutrition_models  # <---- THIS LINE IS REQUIRED
 
-from app.database.db import Base, engine
+from app.nutrition.food_ml_model import USE_FOOD_ML_MODEL, load_active_food_model
 
-# ✅ Now ALL tables will be created correctly in app.db
-Base.metadata.create_all(bind=engine)
+# Tables are created by `python -m scripts.init_db`, not on every worker import
+
+# Warm the food model cache (training one if none exists) at import, so the
+# first /meal doesn't pay for it. Under gunicorn --preload this runs once in
+# the master, before forking, instead of racing in every worker.
+if USE_FOOD_ML_MODEL:
+    load_active_food_model()
 
 app = FastAPI(
     title="BodyTwin Backend",
@@ -7,6 +7,24 @@ For now we keep it rule-based with potential ML extension.
 from typing import Dict
 import math
 
+import numpy as np
+
+# Coefficients shared by the scalar and batch scorers. Each clamped term is
+# max(0, (value - REF) / SPAN) * W; the sleep term is reversed (REF - value).
+_HEART_SBP_REF, _HEART_SBP_SPAN, _HEART_SBP_W = 110, 70, 0.4
+_HEART_BMI_REF, _HEART_BMI_SPAN, _HEART_BMI_W = 22, 15, 0.3
+_HEART_SMOKING_W = 0.1
+_HEART_ALCOHOL_W = 0.05
+
+_METABOLIC_SUGAR_REF, _METABOLIC_SUGAR_SPAN, _METABOLIC_SUGAR_W = 90, 70, 0.4
+_METABOLIC_BMI_REF, _METABOLIC_BMI_SPAN, _METABOLIC_BMI_W = 23, 15, 0.4
+_METABOLIC_CHOL_REF, _METABOLIC_CHOL_SPAN, _METABOLIC_CHOL_W = 180, 120, 0.2
+
+_STRESS_LEVEL_W = 0.25
+_STRESS_SLEEP_REF, _STRESS_SLEEP_SPAN, _STRESS_SLEEP_W = 7, 5, 0.4
+_STRESS_ALCOHOL_W = 0.05
+
+
 def compute_scores_from_features(features: Dict[str, float]) -> Dict[str, float]:
     """
     features may include:
@@ -33,22 +51,22 @@ def compute_scores_from_features(features: Dict[str, float]) -> Dict[str, float]
 
     # Normalize values to 0–1 risk scores (very rough)
     heart_score = 0.0
-    heart_score += max(0, (sbp - 110) / 70) * 0.4
-    heart_score += max(0, (bmi - 22) / 15) * 0.3
-    heart_score += 0.1 * smoking
-    heart_score += 0.05 * alcohol
+    heart_score += max(0, (sbp - _HEART_SBP_REF) / _HEART_SBP_SPAN) * _HEART_SBP_W
+    heart_score += max(0, (bmi - _HEART_BMI_REF) / _HEART_BMI_SPAN) * _HEART_BMI_W
+    heart_score += _HEART_SMOKING_W * smoking
+    heart_score += _HEART_ALCOHOL_W * alcohol
     heart_score = min(1.0, heart_score)
 
     metabolic_score = 0.0
-    metabolic_score += max(0, (sugar - 90) / 70) * 0.4
-    metabolic_score += max(0, (bmi - 23) / 15) * 0.4
-    metabolic_score += max(0, (chol - 180) / 120) * 0.2
+    metabolic_score += max(0, (sugar - _METABOLIC_SUGAR_REF) / _METABOLIC_SUGAR_SPAN) * _METABOLIC_SUGAR_W
+    metabolic_score += max(0, (bmi - _METABOLIC_BMI_REF) / _METABOLIC_BMI_SPAN) * _METABOLIC_BMI_W
+    metabolic_score += max(0, (chol - _METABOLIC_CHOL_REF) / _METABOLIC_CHOL_SPAN) * _METABOLIC_CHOL_W
     metabolic_score = min(1.0, metabolic_score)
 
     mental_stress_score = 0.0
-    mental_stress_score += 0.25 * stress
-    mental_stress_score += max(0, (7 - sleep) / 5) * 0.4
-    mental_stress_score += 0.05 * alcohol
+    mental_stress_score += _STRESS_LEVEL_W * stress
+    mental_stress_score += max(0, (_STRESS_SLEEP_REF - sleep) / _STRESS_SLEEP_SPAN) * _STRESS_SLEEP_W
+    mental_stress_score += _STRESS_ALCOHOL_W * alcohol
     mental_stress_score = min(1.0, mental_stress_score)
 
     organ_load_score = (heart_score + metabolic_score + mental_stress_score) / 3.0
@@ -60,3 +78,54 @@ def compute_scores_from_features(features: Dict[str, float]) -> Dict[str, float]
         "mental_stress_score": mental_stress_score,
         "organ_load_score": organ_load_score,
     }
+
+
+def compute_scores_from_features_batch(
+    features: Dict[str, np.ndarray],
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized compute_scores_from_features: each feature is a 1-D array
+    (one entry per twin) and each returned score is an array of the same
+    length. Used for batch twin creation.
+    """
+
+    bmi = features["bmi"]
+    sbp = features["systolic_bp"]
+    sugar = features["fasting_sugar"]
+    chol = features["cholesterol"]
+    sleep = features["sleep_hours"]
+    stress = features["stress_level"]
+    smoking = features["smoking"]
+    alcohol = features["alcohol"]
+
+    heart_score = (
+        np.maximum(0, (sbp - _HEART_SBP_REF) / _HEART_SBP_SPAN) * _HEART_SBP_W
+        + np.maximum(0, (bmi - _HEART_BMI_REF) / _HEART_BMI_SPAN) * _HEART_BMI_W
+        + _HEART_SMOKING_W * smoking
+        + _HEART_ALCOHOL_W * alcohol
+    )
+    heart_score = np.minimum(1.0, heart_score)
+
+    metabolic_score = (
+        np.maximum(0, (sugar - _METABOLIC_SUGAR_REF) / _METABOLIC_SUGAR_SPAN) * _METABOLIC_SUGAR_W
+        + np.maximum(0, (bmi - _METABOLIC_BMI_REF) / _METABOLIC_BMI_SPAN) * _METABOLIC_BMI_W
+        + np.maximum(0, (chol - _METABOLIC_CHOL_REF) / _METABOLIC_CHOL_SPAN) * _METABOLIC_CHOL_W
+    )
+    metabolic_score = np.minimum(1.0, metabolic_score)
+
+    mental_stress_score = (
+        _STRESS_LEVEL_W * stress
+        + np.maximum(0, (_STRESS_SLEEP_REF - sleep) / _STRESS_SLEEP_SPAN) * _STRESS_SLEEP_W
+        + _STRESS_ALCOHOL_W * alcohol
+    )
+    mental_stress_score = np.minimum(1.0, mental_stress_score)
+
+    organ_load_score = (heart_score + metabolic_score + mental_stress_score) / 3.0
+    organ_load_score = np.minimum(1.0, organ_load_score)
+
+    return {
+        "heart_score": heart_score,
+        "metabolic_score": metabolic_score,
+        "mental_stress_score": mental_stress_score,
+        "organ_load_score": organ_load_score,
+    }
@@ -20,10 +20,13 @@ from sklearn.preprocessing import StandardScaler
 from sklearn.metrics import accuracy_score, f1_score
 from sklearn.model_selection import train_test_split
 
-from joblib import dump, load
+from joblib import dump
+
+from sqlalchemy import func
 
 from app.database.db import SessionLocal
 from app.database.twin_schema import Twin
+from app.utils.model_cache import clear_model_cache, load_model_cached
 
 # ✅ Optional XGBoost
 try:
@@ -35,6 +38,10 @@ except:
 MODELS_DIR = "models"
 META_PATH = os.path.join(MODELS_DIR, "models_meta.json")
 
+# Only upload the winning pipeline to MLflow (every candidate is still
+# dumped locally); set False to log every model's artifact.
+PROMOTE_ONLY_BEST = True
+
 # =========================
 # FILE + META HELPERS
 # =========================
@@ -140,20 +147,43 @@ def _build_label(t: Twin) -> int:
 # LOAD DATA FROM DB ✅ REAL DB
 # =========================
 
-def _load_training_data_from_db():
-    db = SessionLocal()
-    twins = db.query(Twin).all()
-    db.close()
-
-    if len(twins) < 10:
-        raise ValueError("Not enough twins to train model.")
+# Only the columns the feature vector / label read; rows expose them as
+# attributes, so _build_feature_vector works on them unchanged.
+_FEATURE_COLUMNS = (
+    Twin.age, Twin.gender, Twin.weight_kg, Twin.height_cm,
+    Twin.spo2, Twin.resting_hr,
+    Twin.sleep_hours, Twin.screen_time_hours, Twin.exercise_level,
+    Twin.smoking, Twin.alcohol,
+    Twin.daily_steps, Twin.outside_food_per_week, Twin.tea_coffee_per_day,
+    Twin.diet_type,
+    Twin.income, Twin.aqi, Twin.commute_hours, Twin.ac_exposure_hours,
+    Twin.heart_score, Twin.metabolic_score, Twin.mental_stress_score,
+    Twin.lung_risk_score, Twin.organ_load_score,
+)
 
-    X, y = [], []
-    for t in twins:
-        X.append(_build_feature_vector(t))
-        y.append(_build_label(t))
+N_FEATURES = 23
 
-    return np.array(X), np.array(y)
+def _load_training_data_from_db():
+    db = SessionLocal()
+    try:
+        n = db.query(func.count(Twin.id)).scalar()
+        if n < 10:
+            raise ValueError("Not enough twins to train model.")
+
+        X = np.empty((n, N_FEATURES), dtype=np.float64)
+        y = np.empty(n, dtype=np.int64)
+
+        i = 0
+        for t in db.query(*_FEATURE_COLUMNS).yield_per(2000):
+            if i == n:
+                break
+            X[i] = _build_feature_vector(t)
+            y[i] = _build_label(t)
+            i += 1
+    finally:
+        db.close()
+
+    return X[:i], y[:i]
 
 # =========================
 # FULL MLOPS RETRAIN ✅ 7 MODELS
@@ -186,6 +216,7 @@ def retrain_alert_model() -> Dict:
     best_acc = 0
     best_key = None
     best_run = None
+    best_pipe = None
 
     for key, clf in models.items():
         with mlflow.start_run(run_name=f"alert_{key}") as run:
@@ -200,15 +231,15 @@ def retrain_alert_model() -> Dict:
             acc = accuracy_score(y_test, preds)
             f1 = f1_score(y_test, preds, average="macro")
 
-            mlflow.log_metric("accuracy", acc)
-            mlflow.log_metric("f1_macro", f1)
+            mlflow.log_metrics({"accuracy": acc, "f1_macro": f1})
             mlflow.log_param("model", key)
 
             timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
             model_path = os.path.join(MODELS_DIR, f"alert_{key}_{timestamp}.joblib")
 
             dump(pipe, model_path)
-            mlflow.sklearn.log_model(pipe, artifact_path=f"model_{key}")
+            if not PROMOTE_ONLY_BEST:
+                mlflow.sklearn.log_model(pipe, artifact_path=f"model_{key}")
 
             if f1 > best_f1:
                 best_f1 = f1
@@ -216,6 +247,12 @@ def retrain_alert_model() -> Dict:
                 best_model_path = model_path
                 best_key = key
                 best_run = run.info.run_id
+                best_pipe = pipe
+
+    if PROMOTE_ONLY_BEST:
+        # Attach the winner's artifact to its own run
+        with mlflow.start_run(run_id=best_run):
+            mlflow.sklearn.log_model(best_pipe, artifact_path=f"model_{best_key}")
 
     meta = _load_meta()
     for m in meta["models"]:
@@ -233,6 +270,7 @@ def retrain_alert_model() -> Dict:
     })
 
     _save_meta(meta)
+    clear_model_cache("alert")
 
     return {
         "status": "trained_on_real_db",
@@ -252,7 +290,7 @@ def predict_alert_for_twin(twin: Twin) -> Dict:
     if not path:
         return {"error": "No active model found"}
 
-    model = load(path)
+    model = load_model_cached("alert", path)
     features = np.array([_build_feature_vector(twin)])
     pred = int(model.predict(features)[0])
 
@@ -1,6 +1,7 @@
 # app/nutrition/food_ml_model.py
 import os
 import json
+from functools import lru_cache
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
 
@@ -9,11 +10,12 @@ import mlflow
 import mlflow.sklearn
 
 from sklearn.ensemble import RandomForestRegressor
-from sklearn.multioutput import MultiOutputRegressor
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import mean_absolute_error
 
-from joblib import dump, load
+from joblib import dump
+
+from app.utils.model_cache import clear_model_cache, load_model_cached
 
 # Directory for food models (separate from alert models)
 FOOD_MODELS_DIR = "models_food"
@@ -40,6 +42,26 @@ FOOD_DB: Dict[str, Dict[str, float]] = {
 
 FOOD_INDEX = {name: idx for idx, name in enumerate(FOOD_DB.keys())}
 
+_NAME_NORM = str.maketrans({" ": "_"})
+
+
+@lru_cache(maxsize=1024)
+def _resolve_food_index(raw_name: str) -> Optional[int]:
+    # "Aloo Paratha " -> FOOD_INDEX["aloo_paratha"]; None for unknown foods
+    return FOOD_INDEX.get(raw_name.strip().lower().translate(_NAME_NORM))
+
+
+# Per-unit [cal, p, c, f] rows, aligned with FOOD_INDEX. Nutrition is
+# linear in quantity, so this table gives the exact answer the model learns.
+NUTRI = np.array(
+    [[v["cal"], v["p"], v["c"], v["f"]] for v in FOOD_DB.values()],
+    dtype=np.float64,
+)
+
+# Set USE_FOOD_ML_MODEL=1 to serve predictions from the trained
+# RandomForest (MLOps demo) instead of the lookup table.
+USE_FOOD_ML_MODEL = os.getenv("USE_FOOD_ML_MODEL", "0") == "1"
+
 
 def _ensure_food_dirs():
     os.makedirs(FOOD_MODELS_DIR, exist_ok=True)
@@ -106,7 +128,7 @@ def _generate_food_training_data() -> Tuple[np.ndarray, np.ndarray]:
 
 def retrain_food_model() -> Dict:
     """
-    Train a MultiOutputRegressor on synthetic Indian breakfast data.
+    Train a multi-output RandomForestRegressor on synthetic Indian breakfast data.
     Logged to MLflow & best model promoted via meta.
     """
 
@@ -120,9 +142,12 @@ def retrain_food_model() -> Dict:
     mlflow.set_experiment("bodytwin_food_models")
 
     with mlflow.start_run(run_name="food_calorie_model") as run:
-        base = RandomForestRegressor(n_estimators=200, random_state=42)
-        model = MultiOutputRegressor(base)
+        # RandomForestRegressor handles the 4 targets natively: one forest of
+        # 200 trees instead of MultiOutputRegressor's 4 x 200.
+        model = RandomForestRegressor(n_estimators=200, n_jobs=-1, random_state=42)
         model.fit(X_train, y_train)
+        # Per-meal predictions are tiny; don't spin up workers when serving
+        model.set_params(n_jobs=1)
 
         preds = model.predict(X_test)
         mae = float(mean_absolute_error(y_test, preds))
@@ -149,6 +174,7 @@ def retrain_food_model() -> Dict:
             "active": True,
         })
         _save_food_meta(meta)
+        clear_model_cache("food")
 
         return {
             "status": "trained_food_model",
@@ -162,43 +188,51 @@ def retrain_food_model() -> Dict:
 #  PREDICTION HELPER
 # -----------------------------
 
-def _load_active_food_model():
+def load_active_food_model():
     path = get_active_food_model_path()
     if not path or not os.path.exists(path):
         # If no model yet, train one once
         info = retrain_food_model()
         path = info["model_path"]
-    return load(path)
 
+    return load_model_cached("food", path)
 
-def predict_meal_nutrition(items: List[Dict[str, float]]) -> Dict[str, float]:
+
+def predict_meal_nutrition(
+    items: List[Dict[str, float]],
+    model=None,
+) -> Dict[str, float]:
     """
     items: [{ "name": "idli", "quantity": 2 }, ...]
+    model: active food model (the calorie routes pass get_food_model(),
+    which reads it through the model cache); only used when
+    USE_FOOD_ML_MODEL is set, and loaded the same way if not given.
     Returns summed calories, protein, carbs, fat.
     """
-    model = _load_active_food_model()
-
-    total_cal = 0.0
-    total_p = 0.0
-    total_c = 0.0
-    total_f = 0.0
-
+    rows = []
     for item in items:
-        raw_name = item.get("name", "").strip().lower().replace(" ", "_")
-        qty = float(item.get("quantity", 1.0))
-
-        if raw_name not in FOOD_INDEX:
+        idx = _resolve_food_index(item.get("name", ""))
+        if idx is None:
             # Unknown food → skip or assume 0; you can log warning
             continue
 
-        idx = FOOD_INDEX[raw_name]
-        X = np.array([[idx, qty]])
-        cal, p, c, f = model.predict(X)[0]
+        rows.append((idx, float(item.get("quantity", 1.0))))
+
+    if not rows:
+        return {"calories": 0.0, "protein": 0.0, "carbs": 0.0, "fat": 0.0}
+
+    if USE_FOOD_ML_MODEL:
+        # One predict call for the whole meal instead of one per item
+        if model is None:
+            model = load_active_food_model()
+        X = np.asarray(rows, dtype=np.float64)
+        totals = model.predict(X).sum(axis=0)
+    else:
+        idx = [r[0] for r in rows]
+        qty = np.array([r[1] for r in rows], dtype=np.float64)
+        totals = (NUTRI[idx] * qty[:, None]).sum(axis=0)
 
-        total_cal += cal
-        total_p += p
-        total_c += c
-        total_f += f
+    total_cal, total_p, total_c, total_f = totals.tolist()
 
     return {
         "calories": float(total_cal),
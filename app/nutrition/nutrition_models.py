@@ -1,7 +1,7 @@
 # app/nutrition/nutrition_models.py
 from datetime import datetime, date
-from sqlalchemy import Column, Integer, Float, String, Date, DateTime, ForeignKey, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, Float, String, Date, DateTime, ForeignKey, Text, Index, UniqueConstraint
+from sqlalchemy.orm import relationship, column_property
 
 from app.database.db import Base
 
@@ -27,6 +27,11 @@ class MealLog(Base):
 
     twin = relationship("Twin")
 
+    # Serves the per-twin history query (filter twin_id, order date/created_at)
+    __table_args__ = (
+        Index("ix_meal_twin_date", "twin_id", "date", "created_at"),
+    )
+
 
 class DailyCalorieSummary(Base):
     __tablename__ = "daily_calorie_summary"
@@ -37,6 +42,12 @@ class DailyCalorieSummary(Base):
 
     total_calories = Column(Float, default=0.0)
     required_calories = Column(Float, default=0.0)
-    calorie_balance = Column(Float, default=0.0)  # total - required
+    # Derived in SQL on read, so writers only maintain total_calories
+    calorie_balance = column_property(total_calories - required_calories)
 
     twin = relationship("Twin")
+
+    # One row per twin per day; also the conflict target for the UPSERT in log_meal
+    __table_args__ = (
+        UniqueConstraint("twin_id", "date", name="uq_daily_twin_date"),
+    )
@@ -1,16 +1,19 @@
 # app/nutrition/nutrition_service.py
 from datetime import date
-import json
 from typing import List, Dict, Tuple
 
+import orjson
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 
 from app.database.twin_schema import Twin
 from app.nutrition.nutrition_models import MealLog, DailyCalorieSummary
 from app.nutrition.food_ml_model import predict_meal_nutrition
+from app.utils.cache import cache_get, cache_incr
 
 
-def _estimate_required_calories(twin: Twin) -> float:
+def estimate_required_calories(twin: Twin) -> float:
     """
     Simple BMR-based daily calorie need approximation.
     You can explain this formula in your report.
@@ -42,23 +45,47 @@ def _estimate_required_calories(twin: Twin) -> float:
     return float(bmr * factor)
 
 
+def _required_calories(twin: Twin) -> float:
+    # Stored on the twin at creation; older twins fall back to estimating
+    if twin.required_calories is not None:
+        return twin.required_calories
+    return estimate_required_calories(twin)
+
+
+# Cached summaries are keyed by a per-(twin, day) generation that log_meal
+# bumps after committing. A reader that queried the DB before the commit
+# can only store its stale body under the old generation, which nobody
+# reads any more, so no explicit delete (and no set-after-delete race).
+_DAILY_GEN_TTL_SECONDS = 2 * 24 * 3600
+
+
+def _daily_summary_gen_key(twin_id: int, day: date) -> str:
+    return f"dsgen:{twin_id}:{day.isoformat()}"
+
+
+def daily_summary_cache_key(twin_id: int, day: date) -> str:
+    gen = cache_get(_daily_summary_gen_key(twin_id, day))
+    return f"ds:{twin_id}:{day.isoformat()}:{int(gen) if gen else 0}"
+
+
 def log_meal(
     db: Session,
     twin_id: int,
     meal_type: str,
     items: List[Dict[str, float]],
+    food_model=None,
 ) -> Tuple[MealLog, DailyCalorieSummary]:
     """
     Core function:
     - uses ML to predict meal nutrition
     - logs MealLog
-    - updates DailyCalorieSummary
+    - upserts DailyCalorieSummary
     """
     twin = db.query(Twin).filter(Twin.id == twin_id).first()
     if not twin:
         raise ValueError("Twin not found")
 
-    nutrition = predict_meal_nutrition(items)
+    nutrition = predict_meal_nutrition(items, model=food_model)
 
     today = date.today()
 
@@ -66,7 +93,7 @@ def log_meal(
         twin_id=twin_id,
         date=today,
         meal_type=meal_type,
-        food_json=json.dumps(items),
+        food_json=orjson.dumps(items).decode(),
         calories=nutrition["calories"],
         protein=nutrition["protein"],
         carbs=nutrition["carbs"],
@@ -74,47 +101,49 @@ def log_meal(
     )
     db.add(meal)
 
-    daily = (
-        db.query(DailyCalorieSummary)
-        .filter(
-            DailyCalorieSummary.twin_id == twin_id,
-            DailyCalorieSummary.date == today,
-        )
-        .first()
+    # Single atomic UPSERT on (twin_id, date) instead of SELECT + INSERT/UPDATE
+    required = _required_calories(twin)
+    stmt = sqlite_insert(DailyCalorieSummary).values(
+        twin_id=twin_id,
+        date=today,
+        total_calories=nutrition["calories"],
+        required_calories=required,
     )
-
-    if not daily:
-        required = _estimate_required_calories(twin)
-        daily = DailyCalorieSummary(
-            twin_id=twin_id,
-            date=today,
-            total_calories=nutrition["calories"],
-            required_calories=required,
-        )
-        daily.calorie_balance = daily.total_calories - daily.required_calories
-        db.add(daily)
-    else:
-        daily.total_calories += nutrition["calories"]
-        daily.calorie_balance = daily.total_calories - daily.required_calories
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["twin_id", "date"],
+        set_={
+            "total_calories": DailyCalorieSummary.total_calories
+            + stmt.excluded.total_calories,
+        },
+    ).returning(DailyCalorieSummary)
+
+    daily = db.scalars(
+        stmt, execution_options={"populate_existing": True}
+    ).one()
 
     db.commit()
+    cache_incr(_daily_summary_gen_key(twin_id, today), _DAILY_GEN_TTL_SECONDS)
     db.refresh(meal)
     db.refresh(daily)
 
     return meal, daily
 
 
-def get_daily_summary(db: Session, twin_id: int) -> DailyCalorieSummary:
-    today = date.today()
-    daily = (
+def _select_daily(db: Session, twin_id: int, day: date):
+    return (
         db.query(DailyCalorieSummary)
         .filter(
             DailyCalorieSummary.twin_id == twin_id,
-            DailyCalorieSummary.date == today,
+            DailyCalorieSummary.date == day,
         )
         .first()
     )
 
+
+def get_daily_summary(db: Session, twin_id: int) -> DailyCalorieSummary:
+    today = date.today()
+    daily = _select_daily(db, twin_id, today)
+
     if daily:
         return daily
 
@@ -123,24 +152,45 @@ def get_daily_summary(db: Session, twin_id: int) -> DailyCalorieSummary:
     if not twin:
         raise ValueError("Twin not found")
 
-    required = _estimate_required_calories(twin)
-    daily = DailyCalorieSummary(
+    # DO NOTHING if a concurrent /meal upsert created the row in the meantime
+    required = _required_calories(twin)
+    stmt = sqlite_insert(DailyCalorieSummary).values(
         twin_id=twin_id,
         date=today,
         total_calories=0.0,
         required_calories=required,
-        calorie_balance=-required,
-    )
-    db.add(daily)
+    ).on_conflict_do_nothing(index_elements=["twin_id", "date"])
+    db.execute(stmt)
     db.commit()
-    db.refresh(daily)
-    return daily
 
+    return _select_daily(db, twin_id, today)
 
-def get_meal_history(db: Session, twin_id: int) -> List[MealLog]:
+
+def get_meal_history(
+    db: Session,
+    twin_id: int,
+    limit: int = 50,
+    offset: int = 0,
+) -> List[Row]:
+    """
+    One page of a twin's meals, newest first. Only the columns the API
+    returns are selected, so no MealLog instances are built.
+    """
     return (
-        db.query(MealLog)
+        db.query(
+            MealLog.id,
+            MealLog.twin_id,
+            MealLog.date,
+            MealLog.meal_type,
+            MealLog.food_json,
+            MealLog.calories,
+            MealLog.protein,
+            MealLog.carbs,
+            MealLog.fat,
+        )
         .filter(MealLog.twin_id == twin_id)
         .order_by(MealLog.date.desc(), MealLog.created_at.desc())
+        .limit(limit)
+        .offset(offset)
         .all()
     )
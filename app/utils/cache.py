@@ -0,0 +1,71 @@
+# app/utils/cache.py
+"""
+Small TTL cache for ready-to-send response bytes, backed by Redis.
+Only active when REDIS_URL is set and redis is installed: a per-process
+fallback would go stale across gunicorn workers, so without Redis every
+call is a no-op / miss.
+"""
+
+import os
+from typing import Optional
+
+CACHE_TTL_SECONDS = 60
+
+# A dead or hung Redis must behave like a miss, not stall the request
+# (redis-py defaults to 5s, or no timeout at all on older releases)
+REDIS_SOCKET_TIMEOUT_SECONDS = 0.1
+
+# ✅ Optional Redis
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+REDIS_URL = os.getenv("REDIS_URL")
+
+_redis = (
+    redis.Redis.from_url(
+        REDIS_URL,
+        decode_responses=False,
+        socket_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+        socket_connect_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+    )
+    if REDIS_URL and REDIS_AVAILABLE
+    else None
+)
+
+
+def cache_enabled() -> bool:
+    return _redis is not None
+
+
+def cache_get(key: str) -> Optional[bytes]:
+    if _redis is None:
+        return None
+    try:
+        return _redis.get(key)
+    except redis.RedisError:
+        return None
+
+
+def cache_set(key: str, value: bytes, ttl: int = CACHE_TTL_SECONDS):
+    if _redis is None:
+        return
+    try:
+        _redis.set(key, value, ex=ttl)
+    except redis.RedisError:
+        pass
+
+
+def cache_incr(key: str, ttl: int) -> None:
+    """Bump a generation counter (see daily_summary_cache_key)."""
+    if _redis is None:
+        return
+    try:
+        pipe = _redis.pipeline()
+        pipe.incr(key)
+        pipe.expire(key, ttl)
+        pipe.execute()
+    except redis.RedisError:
+        pass
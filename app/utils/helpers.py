@@ -1,4 +1,6 @@
 # app/utils/helpers.py
+from typing import Dict
+
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 
@@ -17,3 +19,16 @@ def get_twin_or_404(db: Session, twin_id: int) -> Twin:
     if not twin:
         raise HTTPException(status_code=404, detail="Twin not found")
     return twin
+
+
+# Column names are fixed per model, so resolve them once at import
+_TWIN_COLUMNS = tuple(c.name for c in Twin.__table__.columns)
+
+
+def twin_to_dict(twin: Twin) -> Dict[str, object]:
+    return {name: getattr(twin, name) for name in _TWIN_COLUMNS}
+
+
+def user_to_dict(user: User) -> Dict[str, object]:
+    # Hand-picked: never expose password_hash
+    return {"id": user.id, "email": user.email, "name": user.name}
@@ -0,0 +1,31 @@
+# app/utils/model_cache.py
+"""
+Per-process cache of deserialized joblib models.
+Holds one (path, mtime, model) slot per model kind ("alert", "food"), so
+a retrain in another worker (new active path) or a rewritten file
+(new mtime) replaces the cached model instead of piling up beside it.
+"""
+
+import os
+from typing import Dict, Tuple
+
+from joblib import load
+
+_SLOTS: Dict[str, Tuple[str, float, object]] = {}
+
+
+def load_model_cached(kind: str, path: str):
+    mtime = os.path.getmtime(path)
+    slot = _SLOTS.get(kind)
+    if slot and slot[0] == path and slot[1] == mtime:
+        return slot[2]
+
+    # Drop the superseded model before loading so both never sit in memory
+    _SLOTS.pop(kind, None)
+    model = load(path)
+    _SLOTS[kind] = (path, mtime, model)
+    return model
+
+
+def clear_model_cache(kind: str) -> None:
+    _SLOTS.pop(kind, None)
@@ -4,6 +4,7 @@ from app.database.db import SessionLocal, Base, engine
 from app.database.user_schema import User
 from app.database.twin_schema import Twin
 from app.core.baseline_model import build_baseline_for_twin
+from app.nutrition.nutrition_service import estimate_required_calories
 import random
 
 # ✅ Make sure tables exist
@@ -83,6 +84,7 @@ for i in range(25):
     )
 
     t = build_baseline_for_twin(t)
+    t.required_calories = estimate_required_calories(t)
     twins.append(t)
 
 db.add_all(twins)
@@ -0,0 +1,72 @@
+# scripts/init_db.py
+
+from sqlalchemy import inspect, text
+from sqlalchemy.orm import Session
+
+from app.database.db import Base, engine
+
+# ✅ Import every model module so all tables register with Base.metadata
+from app.database import user_schema, twin_schema, simulation_schema  # noqa: F401
+from app.nutrition import nutrition_models  # noqa: F401
+from app.database.twin_schema import Twin
+from app.nutrition.nutrition_service import estimate_required_calories
+
+
+def _has_column(conn, table: str, column: str) -> bool:
+    return any(c["name"] == column for c in inspect(conn).get_columns(table))
+
+
+def _migrate(conn):
+    """
+    create_all only creates missing tables, so schema changes to tables that
+    already exist (e.g. the committed app.db) are applied here. Every step
+    must be idempotent: this runs on each container start.
+    """
+
+    # twins.required_calories (stored once per twin instead of per meal)
+    if not _has_column(conn, "twins", "required_calories"):
+        conn.execute(text("ALTER TABLE twins ADD COLUMN required_calories FLOAT"))
+
+    db = Session(bind=conn)
+    for twin in db.query(Twin).filter(Twin.required_calories.is_(None)):
+        twin.required_calories = estimate_required_calories(twin)
+    db.flush()
+
+    # ix_meal_twin_date: serves the paginated meal history query
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_meal_twin_date "
+        "ON meal_logs (twin_id, date, created_at)"
+    ))
+
+    # uq_daily_twin_date: conflict target of the daily summary UPSERT.
+    # Collapse any duplicate (twin_id, date) rows first or the index fails.
+    conn.execute(text("""
+        UPDATE daily_calorie_summary AS d
+        SET total_calories = (
+            SELECT SUM(x.total_calories) FROM daily_calorie_summary AS x
+            WHERE x.twin_id = d.twin_id AND x.date = d.date
+        )
+        WHERE d.id IN (
+            SELECT MIN(id) FROM daily_calorie_summary
+            GROUP BY twin_id, date HAVING COUNT(*) > 1
+        )
+    """))
+    conn.execute(text("""
+        DELETE FROM daily_calorie_summary
+        WHERE id NOT IN (
+            SELECT MIN(id) FROM daily_calorie_summary GROUP BY twin_id, date
+        )
+    """))
+    conn.execute(text(
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_daily_twin_date "
+        "ON daily_calorie_summary (twin_id, date)"
+    ))
+
+
+# ✅ New tables first, then bring existing tables up to date
+Base.metadata.create_all(bind=engine)
+
+with engine.begin() as conn:
+    _migrate(conn)
+
+print("✅ ALL TABLES CREATED / MIGRATED IN app.db ✅")